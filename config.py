@@ -4,13 +4,23 @@ MySQL MCP Server Configuration
 Manages database connection settings for the MCP server.
 """
 
+import functools
 import os
 from pathlib import Path
+from types import MappingProxyType
+
+from aiomysql import DictCursor
 from dotenv import load_dotenv
 
-# Load .env file from project root
+# Load .env file from project root, once per process environment: the
+# marker variable is inherited by reloads and spawned workers, which then
+# skip re-parsing the file
 env_path = Path(__file__).parent / '.env'
-load_dotenv(dotenv_path=env_path)
+_ENV_LOADED_FLAG = '_MYSQL_MCP_ENV_LOADED'
+
+if not os.environ.get(_ENV_LOADED_FLAG) and env_path.is_file():
+    load_dotenv(dotenv_path=env_path, override=False)
+    os.environ[_ENV_LOADED_FLAG] = '1'
 
 
 class DatabaseConfig:
@@ -18,30 +28,37 @@ class DatabaseConfig:
     
     # Database connection parameters
     DB_IP = os.getenv('DB_IP', '******')
-    DB_PORT = os.getenv('DB_PORT', '****')
+    DB_PORT = int(os.getenv('DB_PORT', '3306'))
     DB_NAME = os.getenv('DB_NAME', '*******')
     DB_PASSWD = os.getenv('DB_PASSWD', '*******')
     DB_DATABASE = os.getenv('DB_DATABASE', '*****')
+
+    # Connection pool bounds for this server process
+    DB_POOL_MINSIZE = int(os.getenv('DB_POOL_MINSIZE', '5'))
+    DB_POOL_MAXSIZE = int(os.getenv('DB_POOL_MAXSIZE', '20'))
         
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_connection_params(cls):
         """
-        Get connection parameters as a dictionary for PyMySQL.
+        Get connection parameters as a dictionary for aiomysql.
+        
+        The mapping is built once and cached; it is read-only so callers
+        cannot alter the shared copy.
         
         Returns:
-            Dictionary with connection parameters
+            Read-only mapping with connection parameters
         """
-        from pymysql.cursors import DictCursor
-        return {
+        return MappingProxyType({
             'host': cls.DB_IP,
-            'port': int(cls.DB_PORT),
+            'port': cls.DB_PORT,
             'user': cls.DB_NAME,
             'password': cls.DB_PASSWD,
-            'database': cls.DB_DATABASE,
+            'db': cls.DB_DATABASE,
             'charset': 'utf8mb4',
             'cursorclass': DictCursor,
-            'autocommit': False
-        }
+            'autocommit': True
+        })
     
     @classmethod
     def display_config(cls):
@@ -8,9 +8,18 @@ Uses SSE (Server-Sent Events) for remote HTTP connections.
 """
 
 import asyncio
+import atexit
+import contextlib
+import functools
 import logging
-from typing import Any, Optional
-import json
+import logging.handlers
+import os
+import queue
+import re
+import struct
+import weakref
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Optional, Sequence
 
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
@@ -18,75 +27,285 @@ from starlette.applications import Starlette
 from starlette.routing import Route, Mount
 from starlette.responses import Response
 import uvicorn
+import uvloop
+from cachetools import TTLCache
+import orjson
 
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource, LoggingLevel
-import pymysql
-from pymysql.cursors import DictCursor
+import aiomysql
+from aiomysql import DictCursor, SSDictCursor
+from pymysql.constants import COMMAND, CR
 
 from config import DatabaseConfig
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; WARNING by default, set LOG_LEVEL=INFO or DEBUG for more.
+# Records are only queued on the event loop; a listener thread writes them
+# to stderr, so a slow log sink cannot stall request handling.
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(), handlers=[_queue_handler]
+)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+# Stop at interpreter exit rather than app shutdown, so the final
+# "server stopped" records are still flushed
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger("mysql-mcp-server")
 
 # Create MCP server instance
 app = Server("mysql-mcp-server")
 
+# COM_SET_OPTION payload that turns multi-statement execution off. aiomysql
+# always negotiates CLIENT_MULTI_STATEMENTS, which would let "SELECT 1; DROP
+# TABLE t" past the leading-keyword checks of the tools.
+_MULTI_STATEMENTS_OFF = struct.pack("<H", 1)  # MYSQL_OPTION_MULTI_STATEMENTS_OFF
+
+# Client errors raised when the server has dropped the connection
+# (e.g. after wait_timeout); a read on a fresh connection is safe to retry
+_CONNECTION_LOST_ERRORS = (CR.CR_SERVER_GONE_ERROR, CR.CR_SERVER_LOST)
+
+# Leading statement keyword; only the first token of the SQL is inspected
+_SQL_KIND = re.compile(r"\s*(SELECT|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+# Upper bounds on client-supplied SQL text and parameter lists
+_MAX_SQL_LENGTH = 65536
+_MAX_PARAMS = 256
+
+# Maximum number of statements accepted by one 'batch_query' call
+_MAX_BATCH_QUERIES = 32
+
+# Procedure name in a CREATE [OR REPLACE] PROCEDURE statement
+_CREATE_PROC_RE = re.compile(
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?PROCEDURE\s+`?([\w]+)`?\s*\(", re.IGNORECASE
+)
+# Leading keywords of that statement; checked by the 'execute_procedure' tool
+# and rewritten to CREATE OR REPLACE on MariaDB
+_CREATE_PROC_PREFIX = re.compile(
+    r"\A\s*CREATE\s+(?:OR\s+REPLACE\s+)?PROCEDURE\s", re.IGNORECASE
+)
+
+# Statement kinds accepted by the 'execute' tool
+_WRITE_KINDS = frozenset({"INSERT", "UPDATE", "DELETE"})
+
+# 'table' or 'database.table' made of plain identifier characters
+_IDENT = re.compile(r"([\w$]{1,64})(?:\.([\w$]{1,64}))?")
+
+# orjson options for tool responses. Output is compact: indentation only
+# inflates payloads that clients parse rather than read. OPT_NAIVE_UTC is
+# deliberately left out: DATETIME values carry no time zone.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+# Fixed metadata statements, built once at import time
+_LIST_TABLES_SQL = """
+    SELECT TABLE_SCHEMA, TABLE_NAME
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA NOT IN ('information_schema', 'mysql', 'performance_schema', 'sys')
+    ORDER BY TABLE_SCHEMA, TABLE_NAME
+"""
+
+_TABLE_INFO_SQL = """
+    SELECT
+        TABLE_NAME,
+        ENGINE,
+        TABLE_ROWS,
+        AVG_ROW_LENGTH,
+        DATA_LENGTH,
+        INDEX_LENGTH,
+        CREATE_TIME,
+        UPDATE_TIME,
+        TABLE_COLLATION,
+        TABLE_COMMENT
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+"""
+
+_LIST_DATABASES_SQL = "SHOW DATABASES"
+
+# Per-table statement templates; identifiers cannot be bound as parameters
+_DESCRIBE_SQL = "DESCRIBE {table}"
+_SHOW_CREATE_TABLE_SQL = "SHOW CREATE TABLE {table}"
+_SHOW_INDEX_SQL = "SHOW INDEX FROM {table}"
+
+# Short-lived cache for schema metadata reads, keyed by (tool name, table name)
+_META_CACHE = TTLCache(maxsize=256, ttl=60)
+# One lock per in-flight cache key so concurrent misses load only once
+_META_LOCKS: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
 
 class MySQLConnection:
     """MySQL connection manager with connection pooling."""
 
     def __init__(self):
         self.config = DatabaseConfig.get_connection_params()
-        self.conn = None
-        self.cursor = None
+        self.pool = None
+        # Pooled connections already switched to single-statement mode
+        self._single_statement = weakref.WeakSet()
 
-    def connect(self):
-        """Establish database connection."""
-        if not self.conn or not self.conn.open:
+    async def connect(self):
+        """Create the connection pool and warm up its idle connections."""
+        if self.pool is None:
             try:
-                self.conn = pymysql.connect(**self.config)
-                self.cursor = self.conn.cursor(DictCursor)
-                logger.info("Connected to MySQL database")
-            except pymysql.Error as e:
+                # Recycle connections idle for longer than 30 minutes so
+                # they are replaced before MySQL's wait_timeout kills them
+                self.pool = await aiomysql.create_pool(
+                    minsize=DatabaseConfig.DB_POOL_MINSIZE,
+                    maxsize=DatabaseConfig.DB_POOL_MAXSIZE,
+                    pool_recycle=1800,
+                    **self.config,
+                )
+                logger.info("Created MySQL connection pool")
+            except aiomysql.Error as e:
                 logger.error(f"Failed to connect to MySQL: {e}")
                 raise
 
-    def close(self):
-        """Close database connection."""
-        if self.cursor:
-            self.cursor.close()
-            self.cursor = None
-        if self.conn and self.conn.open:
-            self.conn.close()
-            self.conn = None
-            logger.info("Closed MySQL connection")
-
-    def execute_query(self, sql: str, params: tuple = None) -> list:
+    async def close(self):
+        """Close all pooled connections."""
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+            logger.info("Closed MySQL connection pool")
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self):
+        """Acquire a pooled connection; the pool is opened by the app lifespan.
+
+        Each new connection has multi-statement execution turned off before
+        its first use, so the server rejects anything after a ';'.
+        """
+        if self.pool is None:
+            raise RuntimeError("MySQL connection pool is not open")
+        async with self.pool.acquire() as conn:
+            if conn not in self._single_statement:
+                await conn._execute_command(
+                    COMMAND.COM_SET_OPTION, _MULTI_STATEMENTS_OFF
+                )
+                await conn._read_packet()
+                self._single_statement.add(conn)
+            yield conn
+
+    async def execute_query(self, sql: str, params: Sequence = None) -> list:
         """Execute a SELECT query and return results."""
-        self.connect()
-        try:
-            logger.info(f"Executing query: {sql} with params: {params}")
-            self.cursor.execute(sql, params or ())
-            results = self.cursor.fetchall()
-            return results
-        except pymysql.Error as e:
-            logger.error(f"Query execution failed: {e}")
-            raise
+        for attempt in range(2):
+            async with self._acquire() as conn:
+                try:
+                    async with conn.cursor(DictCursor) as cursor:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Executing query: %s with params: %s", sql, params
+                            )
+                        await cursor.execute(sql, params or None)
+                        results = await cursor.fetchall()
+                        return results
+                except aiomysql.OperationalError as e:
+                    if attempt or e.args[0] not in _CONNECTION_LOST_ERRORS:
+                        logger.error(f"Query execution failed: {e}")
+                        raise
+                    # Close the stale connection so the pool discards it
+                    # on release, then retry once on a fresh one
+                    conn.close()
+                    logger.warning(f"MySQL connection lost, retrying query: {e}")
+                except aiomysql.Error as e:
+                    logger.error(f"Query execution failed: {e}")
+                    raise
+
+    async def iter_query(self, sql: str, params: Sequence = None):
+        """Execute a SELECT query and yield rows as they arrive.
+
+        Uses an unbuffered server-side cursor, so rows are streamed from
+        MySQL instead of being fetched into memory all at once.
+        """
+        for attempt in range(2):
+            async with self._acquire() as conn:
+                cursor = await conn.cursor(SSDictCursor)
+                # Whether the connection can go back to the pool as is
+                reusable = False
+                try:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Executing query: %s with params: %s", sql, params)
+                    try:
+                        await cursor.execute(sql, params or None)
+                    except aiomysql.Error as e:
+                        lost = (
+                            isinstance(e, aiomysql.OperationalError)
+                            and e.args[0] in _CONNECTION_LOST_ERRORS
+                        )
+                        if lost and not attempt:
+                            # No row has been yielded yet, so retrying once on
+                            # a fresh connection cannot duplicate output; the
+                            # finally below closes the stale one
+                            logger.warning(
+                                f"MySQL connection lost, retrying query: {e}"
+                            )
+                            continue
+                        # Server-side errors (syntax, unknown table, ...)
+                        # leave the connection clean
+                        reusable = not lost and not isinstance(
+                            e, aiomysql.InterfaceError
+                        )
+                        raise
+                    async for row in cursor:
+                        yield row
+                    reusable = True
+                    return
+                except aiomysql.Error as e:
+                    logger.error(f"Query execution failed: {e}")
+                    raise
+                finally:
+                    if reusable:
+                        await cursor.close()
+                    else:
+                        # Closing an unbuffered cursor reads the rest of the
+                        # result set off the wire. When the caller stops
+                        # early (max_rows, cancellation) or the connection
+                        # broke, close the connection instead; the pool
+                        # discards it on release.
+                        conn.close()
+
+    async def execute_batch(self, queries: Sequence[tuple]) -> list:
+        """Execute several SELECT queries in order on one pooled connection.
+
+        Args:
+            queries: (sql, params) pairs; params may be None
 
-    def execute_update(self, sql: str, params: tuple = None) -> int:
+        Returns:
+            One list of result rows per query
+        """
+        results = []
+        async with self._acquire() as conn:
+            async with conn.cursor(DictCursor) as cursor:
+                try:
+                    for sql, params in queries:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Executing batch query: %s with params: %s",
+                                sql,
+                                params,
+                            )
+                        await cursor.execute(sql, params or None)
+                        results.append(await cursor.fetchall())
+                except aiomysql.Error as e:
+                    logger.error(f"Batch query execution failed: {e}")
+                    raise
+        return results
+
+    async def execute_update(self, sql: str, params: Sequence = None) -> int:
         """Execute an INSERT/UPDATE/DELETE query and return affected rows."""
-        self.connect()
-        try:
-            affected_rows = self.cursor.execute(sql, params or ())
-            self.conn.commit()
-            return affected_rows
-        except pymysql.Error as e:
-            self.conn.rollback()
-            logger.error(f"Update execution failed: {e}")
-            raise
+        async with self._acquire() as conn:
+            async with conn.cursor(DictCursor) as cursor:
+                try:
+                    affected_rows = await cursor.execute(sql, params or None)
+                    return affected_rows
+                except aiomysql.Error as e:
+                    logger.error(f"Update execution failed: {e}")
+                    raise
 
-    def execute_procedure(
+    async def execute_procedure(
         self, procedure_sql: str, call_params: list = None, cleanup: bool = True
     ) -> dict:
         """Execute a stored procedure from full CREATE PROCEDURE statement.
@@ -99,18 +318,21 @@ class MySQLConnection:
         Returns:
             dict with affected_rows, result_sets, and result_count
         """
-        self.connect()
+        async with self._acquire() as conn:
+            async with conn.cursor(DictCursor) as cursor:
+                return await self._run_procedure(
+                    conn, cursor, procedure_sql, call_params, cleanup
+                )
+
+    async def _run_procedure(
+        self, conn, cursor, procedure_sql: str, call_params: list, cleanup: bool
+    ) -> dict:
+        """Create, call and optionally drop a procedure on one pooled connection."""
         procedure_name = None
 
         try:
             # Extract procedure name from CREATE PROCEDURE statement
-            import re
-
-            match = re.search(
-                r"CREATE\s+(?:OR\s+REPLACE\s+)?PROCEDURE\s+`?([\w]+)`?\s*\(",
-                procedure_sql,
-                re.IGNORECASE,
-            )
+            match = _CREATE_PROC_RE.search(procedure_sql)
             if not match:
                 raise ValueError(
                     "Invalid CREATE PROCEDURE statement: cannot extract procedure name"
@@ -119,27 +341,36 @@ class MySQLConnection:
             procedure_name = match.group(1)
             logger.info(f"Extracted procedure name: {procedure_name}")
 
-            # Drop procedure if exists
-            try:
-                drop_sql = f"DROP PROCEDURE IF EXISTS `{procedure_name}`"
-                self.cursor.execute(drop_sql)
-                logger.info(f"Dropped existing procedure: {procedure_name}")
-            except pymysql.Error as e:
-                logger.warning(f"Failed to drop procedure: {e}")
-
-            # Create the procedure
-            self.cursor.execute(procedure_sql)
-            self.conn.commit()
+            if "MariaDB" in conn.get_server_info():
+                # MariaDB replaces an existing procedure in the CREATE
+                # itself, saving the separate DROP round-trip
+                procedure_sql = _CREATE_PROC_PREFIX.sub(
+                    "CREATE OR REPLACE PROCEDURE ", procedure_sql, count=1
+                )
+            else:
+                # Drop procedure if exists
+                try:
+                    drop_sql = f"DROP PROCEDURE IF EXISTS `{procedure_name}`"
+                    await cursor.execute(drop_sql)
+                    logger.info(f"Dropped existing procedure: {procedure_name}")
+                except aiomysql.Error as e:
+                    logger.warning(f"Failed to drop procedure: {e}")
+
+            # Create the procedure; DDL commits implicitly and the pool is
+            # autocommit, so no explicit COMMIT is needed for CREATE/DROP
+            await cursor.execute(procedure_sql)
             logger.info(f"Created procedure: {procedure_name}")
 
-            # Call the procedure
+            # Call the procedure inside an explicit transaction so that a
+            # failure rolls back everything it wrote (the pool is autocommit)
+            await conn.begin()
             if call_params:
                 placeholders = ", ".join(["%s"] * len(call_params))
                 call_sql = f"CALL `{procedure_name}`({placeholders})"
-                affected_rows = self.cursor.execute(call_sql, tuple(call_params))
+                affected_rows = await cursor.execute(call_sql, tuple(call_params))
             else:
                 call_sql = f"CALL `{procedure_name}`()"
-                affected_rows = self.cursor.execute(call_sql)
+                affected_rows = await cursor.execute(call_sql)
 
             logger.info(f"Called procedure: {call_sql}")
 
@@ -147,20 +378,20 @@ class MySQLConnection:
             results = []
             try:
                 # Get the first result set
-                result_set = self.cursor.fetchall()
+                result_set = await cursor.fetchall()
                 if result_set:
                     results.append(result_set)
 
                 # Get additional result sets if any
-                while self.cursor.nextset():
-                    result_set = self.cursor.fetchall()
+                while await cursor.nextset():
+                    result_set = await cursor.fetchall()
                     if result_set:
                         results.append(result_set)
             except Exception:
                 # No result set to fetch
                 pass
 
-            self.conn.commit()
+            await conn.commit()
 
             return {
                 "affected_rows": affected_rows,
@@ -169,8 +400,8 @@ class MySQLConnection:
                 "procedure_name": procedure_name,
             }
 
-        except pymysql.Error as e:
-            self.conn.rollback()
+        except aiomysql.Error as e:
+            await conn.rollback()
             logger.error(f"Procedure execution failed: {e}")
             raise
         finally:
@@ -178,10 +409,9 @@ class MySQLConnection:
             if cleanup and procedure_name:
                 try:
                     drop_sql = f"DROP PROCEDURE IF EXISTS `{procedure_name}`"
-                    self.cursor.execute(drop_sql)
-                    self.conn.commit()
+                    await cursor.execute(drop_sql)
                     logger.info(f"Cleaned up procedure: {procedure_name}")
-                except pymysql.Error as e:
+                except aiomysql.Error as e:
                     logger.warning(f"Failed to cleanup procedure: {e}")
 
 
@@ -189,498 +419,782 @@ class MySQLConnection:
 db = MySQLConnection()
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available MySQL tools."""
-    return [
-        Tool(
-            name="query",
-            description="执行 MySQL 的 SELECT 查询。返回查询结果的 JSON 数组。支持可选参数化查询。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sql": {
-                        "type": "string",
-                        "description": "要执行的 SELECT 语句。",
-                    },
-                    "params": {
-                        "type": "array",
-                        "description": "SQL 参数列表（用于预处理语句）。",
-                        "items": {"type": "string"},
-                    },
+def _jdump(obj: Any) -> str:
+    """Serialize a tool response to compact JSON text."""
+    return orjson.dumps(obj, default=str, option=_ORJSON_OPTS).decode()
+
+
+def _sql_kind(sql: str) -> str:
+    """Return the leading SELECT/INSERT/UPDATE/DELETE keyword, or ''."""
+    match = _SQL_KIND.match(sql)
+    return match.group(1).upper() if match else ""
+
+
+def _check_payload_size(arguments: dict) -> None:
+    """Raise ValueError if any SQL text or parameter list exceeds its limit."""
+    entries = [arguments, *(arguments.get("queries") or ())]
+    for entry in entries:
+        for key in ("sql", "procedure_sql"):
+            text = entry.get(key)
+            if text and len(text) > _MAX_SQL_LENGTH:
+                raise ValueError(
+                    f"SQL too large: {len(text)} characters "
+                    f"(limit {_MAX_SQL_LENGTH})"
+                )
+        for key in ("params", "call_params"):
+            values = entry.get(key)
+            if values and len(values) > _MAX_PARAMS:
+                raise ValueError(
+                    f"Too many parameters: {len(values)} (limit {_MAX_PARAMS})"
+                )
+
+
+def _split_table_name(table_name: str) -> tuple:
+    """Split 'table' or 'database.table' into (database or None, table).
+
+    Raises:
+        ValueError: If either part contains anything but word characters
+            and '$'; this keeps backticks out of the quoted identifiers.
+    """
+    match = _IDENT.fullmatch(table_name)
+    if not match:
+        raise ValueError(f"Invalid table name: {table_name}")
+    first, second = match.groups()
+    return (first, second) if second else (None, first)
+
+
+@functools.lru_cache(maxsize=256)
+def _table_sql(template: str, table_name: str) -> str:
+    """Fill a per-table template, quoting 'table' or 'database.table' names."""
+    db_name, table = _split_table_name(table_name)
+    if db_name:
+        return template.format(table=f"`{db_name}`.`{table}`")
+    return template.format(table=f"`{table}`")
+
+
+async def _cached(key: tuple, load: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for key, awaiting load() on a miss.
+
+    Empty results are not cached: they usually mean the object does not
+    exist yet, and a table created by another client must show up at once.
+    """
+    result = _META_CACHE.get(key)
+    if result is not None:
+        return result
+    lock = _META_LOCKS.get(key)
+    if lock is None:
+        lock = _META_LOCKS[key] = asyncio.Lock()
+    async with lock:
+        # Another caller may have filled the entry while we waited
+        result = _META_CACHE.get(key)
+        if result is None:
+            result = await load()
+            if result:
+                _META_CACHE[key] = result
+    return result
+
+
+async def _cached_query(key: tuple, sql: str, params: Sequence = None) -> list:
+    """Execute a metadata query, serving repeats within the TTL from memory."""
+    return await _cached(key, lambda: db.execute_query(sql, params))
+
+
+# Tool definitions are static, so build them once at import time
+_TOOLS: list[Tool] = [
+    Tool(
+        name="query",
+        description="执行 MySQL 的 SELECT 查询。返回查询结果的 JSON 数组。支持可选参数化查询。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "要执行的 SELECT 语句。",
+                },
+                "params": {
+                    "type": "array",
+                    "description": "SQL 参数列表（用于预处理语句）。",
+                    "items": {"type": "string"},
+                },
+                "max_rows": {
+                    "type": "integer",
+                    "description": "最多返回的行数（可选）。超出部分会被截断，并在结果中标记 truncated。",
+                    "minimum": 1,
                 },
-                "required": ["sql"],
             },
-        ),
-        Tool(
-            name="execute",
-            description="执行 INSERT、UPDATE 或 DELETE 语句（不支持 SELECT）。返回受影响的行数。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sql": {
-                        "type": "string",
-                        "description": "要执行的 INSERT/UPDATE/DELETE 语句。",
-                    },
-                    "params": {
-                        "type": "array",
-                        "description": "SQL 参数列表（用于预处理语句）。",
-                        "items": {"type": "string"},
+            "required": ["sql"],
+        },
+    ),
+    Tool(
+        name="batch_query",
+        description="在同一个数据库连接上依次执行多条 SELECT 查询（最多 32 条），一次性返回所有结果。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "queries": {
+                    "type": "array",
+                    "description": "要执行的查询列表。",
+                    "maxItems": _MAX_BATCH_QUERIES,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "sql": {
+                                "type": "string",
+                                "description": "要执行的 SELECT 语句。",
+                            },
+                            "params": {
+                                "type": "array",
+                                "description": "SQL 参数列表（用于预处理语句）。",
+                                "items": {"type": "string"},
+                            },
+                        },
+                        "required": ["sql"],
                     },
                 },
-                "required": ["sql"],
             },
-        ),
-        Tool(
-            name="list_tables",
-            description="列出 MySQL 服务器中所有非系统数据库的所有表，并按数据库进行分组。",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="describe_table",
-            description="获取指定表的结构信息，包括字段、类型、约束等。支持 'database.table' 格式。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "要描述的表名，支持 'database.table' 格式。",
-                    }
+            "required": ["queries"],
+        },
+    ),
+    Tool(
+        name="execute",
+        description="执行 INSERT、UPDATE 或 DELETE 语句（不支持 SELECT）。返回受影响的行数。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "要执行的 INSERT/UPDATE/DELETE 语句。",
                 },
-                "required": ["table_name"],
-            },
-        ),
-        Tool(
-            name="get_table_info",
-            description="获取指定表的详细信息，包括行数、大小、创建时间等。支持 'database.table' 格式。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "表名，支持 'database.table' 格式。",
-                    }
+                "params": {
+                    "type": "array",
+                    "description": "SQL 参数列表（用于预处理语句）。",
+                    "items": {"type": "string"},
                 },
-                "required": ["table_name"],
             },
-        ),
-        Tool(
-            name="list_databases",
-            description="列出 MySQL 服务器中所有可用的数据库（不包含系统库）。",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="show_create_table",
-            description="返回指定表的 CREATE TABLE 语句。支持 'database.table' 格式。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "表名，支持 'database.table' 格式。",
-                    }
-                },
-                "required": ["table_name"],
+            "required": ["sql"],
+        },
+    ),
+    Tool(
+        name="list_tables",
+        description="列出 MySQL 服务器中所有非系统数据库的所有表，并按数据库进行分组。",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="describe_table",
+        description="获取指定表的结构信息，包括字段、类型、约束等。支持 'database.table' 格式。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "要描述的表名，支持 'database.table' 格式。",
+                }
             },
-        ),
-        Tool(
-            name="get_table_indexes",
-            description="获取指定表的所有索引定义，包括主键、唯一索引和普通索引等。支持 'database.table' 格式。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "表名，支持 'database.table' 格式。",
-                    }
-                },
-                "required": ["table_name"],
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="get_table_info",
+        description="获取指定表的详细信息，包括行数、大小、创建时间等。支持 'database.table' 格式。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "表名，支持 'database.table' 格式。",
+                }
             },
-        ),
-        Tool(
-            name="validate_query",
-            description="使用 EXPLAIN 校验 SQL 语句是否有效（只检查语法，不执行查询）。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sql": {
-                        "type": "string",
-                        "description": "要校验的 SQL 语句。",
-                    }
-                },
-                "required": ["sql"],
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="list_databases",
+        description="列出 MySQL 服务器中所有可用的数据库（不包含系统库）。",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="show_create_table",
+        description="返回指定表的 CREATE TABLE 语句。支持 'database.table' 格式。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "表名，支持 'database.table' 格式。",
+                }
             },
-        ),
-        Tool(
-            name="execute_procedure",
-            description="执行完整的存储过程。传入完整的 CREATE PROCEDURE 语句，系统会自动创建、执行并清理该存储过程。支持返回多个结果集。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "procedure_sql": {
-                        "type": "string",
-                        "description": "完整的 CREATE PROCEDURE 语句，例如：CREATE PROCEDURE test_proc() BEGIN SELECT * FROM users; END",
-                    },
-                    "call_params": {
-                        "type": "array",
-                        "description": "调用存储过程时传入的参数列表（可选）。",
-                        "items": {"type": "string"},
-                    },
-                    "cleanup": {
-                        "type": "boolean",
-                        "description": "执行后是否删除该存储过程（默认为 true）。",
-                        "default": True,
-                    },
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="get_table_indexes",
+        description="获取指定表的所有索引定义，包括主键、唯一索引和普通索引等。支持 'database.table' 格式。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "表名，支持 'database.table' 格式。",
+                }
+            },
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="get_table_overview",
+        description="一次性获取指定表的详细信息、字段结构和索引定义（并发查询）。支持 'database.table' 格式。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "表名，支持 'database.table' 格式。",
+                }
+            },
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="validate_query",
+        description="使用 EXPLAIN 校验 SQL 语句是否有效（只检查语法，不执行查询）。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sql": {
+                    "type": "string",
+                    "description": "要校验的 SQL 语句。",
+                }
+            },
+            "required": ["sql"],
+        },
+    ),
+    Tool(
+        name="execute_procedure",
+        description="执行完整的存储过程。传入完整的 CREATE PROCEDURE 语句，系统会自动创建、执行并清理该存储过程。支持返回多个结果集。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "procedure_sql": {
+                    "type": "string",
+                    "description": "完整的 CREATE PROCEDURE 语句，例如：CREATE PROCEDURE test_proc() BEGIN SELECT * FROM users; END",
+                },
+                "call_params": {
+                    "type": "array",
+                    "description": "调用存储过程时传入的参数列表（可选）。",
+                    "items": {"type": "string"},
+                },
+                "cleanup": {
+                    "type": "boolean",
+                    "description": "执行后是否删除该存储过程（默认为 true）。",
+                    "default": True,
                 },
-                "required": ["procedure_sql"],
             },
-        ),
-    ]
-
-
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool execution requests."""
-    logger.info(f"Tool called: {name} with arguments: {arguments}")
-
-    # Extract SQL for error reporting
-    sql = arguments.get("sql", "")
-    table_name = arguments.get("table_name", "")
+            "required": ["procedure_sql"],
+        },
+    ),
+    Tool(
+        name="invalidate_schema_cache",
+        description="清空表结构等元数据查询的缓存（缓存有效期 60 秒）。在修改表结构后调用，确保后续查询返回最新结果。",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+]
+
+
+async def _tool_query(arguments: dict) -> list[TextContent]:
+    """Run a read-only SELECT, streaming rows straight into the JSON response."""
+    sql = arguments.get("sql")
+    params = arguments.get("params") or None
+    max_rows = arguments.get("max_rows")
+
+    if not sql:
+        raise ValueError("SQL query is required")
+    if max_rows is not None and (
+        not isinstance(max_rows, int) or isinstance(max_rows, bool) or max_rows < 1
+    ):
+        raise ValueError("max_rows must be a positive integer")
+
+    # Ensure it's a SELECT query
+    if _sql_kind(sql) != "SELECT":
+        raise ValueError("Only SELECT queries are allowed for 'query' tool")
+
+    # Encode rows one at a time as they stream in, so the result set
+    # is never held as dicts and JSON text at the same time, and stop
+    # reading once max_rows is reached. aclosing() hands the
+    # connection back as soon as the loop exits early.
+    rows_json = bytearray()
+    row_count = 0
+    truncated = False
+    async with contextlib.aclosing(db.iter_query(sql, params)) as rows:
+        async for row in rows:
+            if row_count == max_rows:
+                truncated = True
+                break
+            if row_count:
+                rows_json += b","
+            rows_json += orjson.dumps(row, default=str)
+            row_count += 1
+
+    if truncated:
+        logger.warning("Query result truncated to max_rows=%d: %.200s", max_rows, sql)
+
+    response_text = (
+        b'{"executeSql":'
+        + orjson.dumps(sql)
+        + b',"success":true,"rowCount":'
+        + str(row_count).encode()
+        + (b',"truncated":true' if truncated else b"")
+        + b',"execute_result_data":['
+        + rows_json
+        + b"]}"
+    ).decode()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _tool_batch_query(arguments: dict) -> list[TextContent]:
+    """Run several SELECT statements on one pooled connection."""
+    queries = arguments.get("queries")
+
+    if not queries:
+        raise ValueError("queries is required")
+    if len(queries) > _MAX_BATCH_QUERIES:
+        raise ValueError(f"At most {_MAX_BATCH_QUERIES} queries are allowed per batch")
+
+    batch = []
+    for query in queries:
+        query_sql = query.get("sql")
+        if not query_sql:
+            raise ValueError("SQL query is required")
+        if _sql_kind(query_sql) != "SELECT":
+            raise ValueError("Only SELECT queries are allowed for 'batch_query' tool")
+        batch.append((query_sql, query.get("params") or None))
+
+    results = await db.execute_batch(batch)
+
+    response_data = {
+        "executeSql": [query_sql for query_sql, _ in batch],
+        "success": True,
+        "queryCount": len(results),
+        "execute_result_data": [
+            {"rowCount": len(rows), "data": rows} for rows in results
+        ],
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Batch query tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _tool_execute(arguments: dict) -> list[TextContent]:
+    """Run a single INSERT, UPDATE or DELETE statement."""
+    sql = arguments.get("sql")
+    params = arguments.get("params") or None
+
+    if not sql:
+        raise ValueError("SQL query is required")
+
+    # Ensure it's not a SELECT query
+    kind = _sql_kind(sql)
+    if kind == "SELECT":
+        raise ValueError("Use 'query' tool for SELECT statements")
+
+    # Only allow INSERT, UPDATE, DELETE
+    if kind not in _WRITE_KINDS:
+        raise ValueError("Only INSERT, UPDATE, DELETE queries are allowed")
+
+    affected_rows = await db.execute_update(sql, params)
+
+    response_data = {
+        "executeSql": sql,
+        "success": True,
+        "execute_result_affectedRows": affected_rows,
+        "message": f"Successfully affected {affected_rows} row(s)",
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Execute tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _tool_list_tables(arguments: dict) -> list[TextContent]:
+    """List all tables grouped by database."""
+    # Query all tables from all databases using information_schema
+    sql = _LIST_TABLES_SQL
+
+    async def load_tables_by_db():
+        # Group tables by database while rows stream in, so the full
+        # row list is never materialized
+        tables_by_db = defaultdict(list)
+        async for row in db.iter_query(sql):
+            tables_by_db[row["TABLE_SCHEMA"]].append(row["TABLE_NAME"])
+        return dict(tables_by_db)
+
+    tables_by_db = await _cached(("list_tables", ""), load_tables_by_db)
+    total_tables = sum(len(tables) for tables in tables_by_db.values())
+
+    response_data = {
+        "executeSql": sql,
+        "success": True,
+        "databaseCount": len(tables_by_db),
+        "totalTableCount": total_tables,
+        "execute_result_tablesByDatabase": tables_by_db,
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("List tables tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _tool_describe_table(arguments: dict) -> list[TextContent]:
+    """Return the column definitions of a table."""
+    table_name = arguments.get("table_name")
+    if not table_name:
+        raise ValueError("table_name is required")
+
+    sql = _table_sql(_DESCRIBE_SQL, table_name)
+
+    results = await _cached_query(("describe_table", table_name), sql)
+
+    response_data = {
+        "executeSql": sql,
+        "success": True,
+        "table": table_name,
+        "execute_result_columns": results,
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Describe table tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _tool_get_table_info(arguments: dict) -> list[TextContent]:
+    """Return information_schema metadata for a table."""
+    table_name = arguments.get("table_name")
+    if not table_name:
+        raise ValueError("table_name is required")
+
+    # Support database.table format
+    db_name, actual_table_name = _split_table_name(table_name)
+    if db_name is None:
+        db_name = db.config.get("db")
+
+    sql = _TABLE_INFO_SQL
+    results = await _cached_query(
+        ("get_table_info", table_name), sql, (db_name, actual_table_name)
+    )
 
-    try:
-        if name == "query":
-            sql = arguments.get("sql")
-            params = tuple(arguments.get("params", []))
+    if not results:
+        raise ValueError(f"Table '{table_name}' not found")
 
-            if not sql:
-                raise ValueError("SQL query is required")
+    response_data = {
+        "executeSql": sql,
+        "success": True,
+        "execute_result_tableInfo": results[0],
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Get table info tool response: %s", response_text)
 
-            # Ensure it's a SELECT query
-            if not sql.strip().upper().startswith("SELECT"):
-                raise ValueError("Only SELECT queries are allowed for 'query' tool")
+    return [TextContent(type="text", text=response_text)]
 
-            results = db.execute_query(sql, params if params else None)
 
-            response_data = {
-                "executeSql": sql,
-                "success": True,
-                "rowCount": len(results),
-                "execute_result_data": results,
-            }
-            response_text = json.dumps(
-                response_data, indent=2, ensure_ascii=False, default=str
-            )
-            logger.info(f"Query tool response: {response_text}")
+async def _tool_list_databases(arguments: dict) -> list[TextContent]:
+    """List all databases on the server."""
+    sql = _LIST_DATABASES_SQL
+    results = await _cached_query(("list_databases", ""), sql)
 
-            return [TextContent(type="text", text=response_text)]
+    databases = [row["Database"] for row in results]
 
-        elif name == "execute":
-            sql = arguments.get("sql")
-            params = tuple(arguments.get("params", []))
+    response_data = {
+        "executeSql": sql,
+        "success": True,
+        "databaseCount": len(databases),
+        "execute_result_databases": databases,
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("List databases tool response: %s", response_text)
 
-            if not sql:
-                raise ValueError("SQL query is required")
+    return [TextContent(type="text", text=response_text)]
 
-            # Ensure it's not a SELECT query
-            sql_upper = sql.strip().upper()
-            if sql_upper.startswith("SELECT"):
-                raise ValueError("Use 'query' tool for SELECT statements")
 
-            # Only allow INSERT, UPDATE, DELETE
-            if not any(
-                sql_upper.startswith(cmd) for cmd in ["INSERT", "UPDATE", "DELETE"]
-            ):
-                raise ValueError("Only INSERT, UPDATE, DELETE queries are allowed")
+async def _tool_show_create_table(arguments: dict) -> list[TextContent]:
+    """Return the CREATE TABLE statement of a table."""
+    table_name = arguments.get("table_name")
+    if not table_name:
+        raise ValueError("table_name is required")
 
-            affected_rows = db.execute_update(sql, params if params else None)
+    sql = _table_sql(_SHOW_CREATE_TABLE_SQL, table_name)
 
-            response_data = {
-                "executeSql": sql,
-                "success": True,
-                "execute_result_affectedRows": affected_rows,
-                "message": f"Successfully affected {affected_rows} row(s)",
-            }
-            response_text = json.dumps(response_data, indent=2)
-            logger.info(f"Execute tool response: {response_text}")
-
-            return [TextContent(type="text", text=response_text)]
-
-        elif name == "list_tables":
-            # Query all tables from all databases using information_schema
-            sql = """
-                SELECT TABLE_SCHEMA, TABLE_NAME
-                FROM information_schema.TABLES
-                WHERE TABLE_SCHEMA NOT IN ('information_schema', 'mysql', 'performance_schema', 'sys')
-                ORDER BY TABLE_SCHEMA, TABLE_NAME
-            """
-            results = db.execute_query(sql)
-
-            # Group tables by database
-            tables_by_db = {}
-            total_tables = 0
-            for row in results:
-                db_name = row["TABLE_SCHEMA"]
-                table_name = row["TABLE_NAME"]
-                if db_name not in tables_by_db:
-                    tables_by_db[db_name] = []
-                tables_by_db[db_name].append(table_name)
-                total_tables += 1
-
-            response_data = {
-                "executeSql": sql,
-                "success": True,
-                "databaseCount": len(tables_by_db),
-                "totalTableCount": total_tables,
-                "execute_result_tablesByDatabase": tables_by_db,
-            }
-            response_text = json.dumps(response_data, indent=2, ensure_ascii=False)
-            logger.info(f"List tables tool response: {response_text}")
-
-            return [TextContent(type="text", text=response_text)]
+    results = await _cached_query(("show_create_table", table_name), sql)
 
-        elif name == "describe_table":
-            table_name = arguments.get("table_name")
-            if not table_name:
-                raise ValueError("table_name is required")
+    if results:
+        create_statement = results[0].get("Create Table", "")
+        response_data = {
+            "executeSql": sql,
+            "success": True,
+            "table": table_name,
+            "execute_result_createStatement": create_statement,
+        }
+        response_text = _jdump(response_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Show create table tool response: %s", response_text)
 
-            # Support database.table format
-            if "." in table_name:
-                parts = table_name.split(".", 1)
-                sql = f"DESCRIBE `{parts[0]}`.`{parts[1]}`"
-            else:
-                sql = f"DESCRIBE `{table_name}`"
-
-            results = db.execute_query(sql)
-
-            response_data = {
-                "executeSql": sql,
-                "success": True,
-                "table": table_name,
-                "execute_result_columns": results,
-            }
-            response_text = json.dumps(response_data, indent=2, ensure_ascii=False)
-            logger.info(f"Describe table tool response: {response_text}")
-
-            return [TextContent(type="text", text=response_text)]
+        return [TextContent(type="text", text=response_text)]
+    else:
+        raise ValueError(f"Table '{table_name}' not found")
+
+
+async def _tool_get_table_indexes(arguments: dict) -> list[TextContent]:
+    """Return the indexes of a table."""
+    table_name = arguments.get("table_name")
+    if not table_name:
+        raise ValueError("table_name is required")
+
+    sql = _table_sql(_SHOW_INDEX_SQL, table_name)
+
+    results = await _cached_query(("get_table_indexes", table_name), sql)
+
+    response_data = {
+        "executeSql": sql,
+        "success": True,
+        "table": table_name,
+        "execute_result_indexes": results,
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Get table indexes tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _tool_get_table_overview(arguments: dict) -> list[TextContent]:
+    """Return table metadata, columns and indexes in one response."""
+    table_name = arguments.get("table_name")
+    if not table_name:
+        raise ValueError("table_name is required")
+
+    db_name, actual_table_name = _split_table_name(table_name)
+    if db_name is None:
+        db_name = db.config.get("db")
+    describe_sql = _table_sql(_DESCRIBE_SQL, table_name)
+    index_sql = _table_sql(_SHOW_INDEX_SQL, table_name)
+
+    # The three reads are independent, so run them concurrently on
+    # separate pooled connections; the per-table tools share the cache
+    info, columns, indexes = await asyncio.gather(
+        _cached_query(
+            ("get_table_info", table_name),
+            _TABLE_INFO_SQL,
+            (db_name, actual_table_name),
+        ),
+        _cached_query(("describe_table", table_name), describe_sql),
+        _cached_query(("get_table_indexes", table_name), index_sql),
+    )
 
-        elif name == "get_table_info":
-            table_name = arguments.get("table_name")
-            if not table_name:
-                raise ValueError("table_name is required")
+    if not info:
+        raise ValueError(f"Table '{table_name}' not found")
 
-            # Support database.table format
-            if "." in table_name:
-                parts = table_name.split(".", 1)
-                db_name = parts[0]
-                actual_table_name = parts[1]
-            else:
-                db_name = db.config.get("database")
-                actual_table_name = table_name
-
-            sql = """
-                SELECT 
-                    TABLE_NAME,
-                    ENGINE,
-                    TABLE_ROWS,
-                    AVG_ROW_LENGTH,
-                    DATA_LENGTH,
-                    INDEX_LENGTH,
-                    CREATE_TIME,
-                    UPDATE_TIME,
-                    TABLE_COLLATION,
-                    TABLE_COMMENT
-                FROM information_schema.TABLES
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-            """
-            results = db.execute_query(sql, (db_name, actual_table_name))
-
-            if not results:
-                raise ValueError(f"Table '{table_name}' not found")
+    response_data = {
+        "executeSql": [_TABLE_INFO_SQL, describe_sql, index_sql],
+        "success": True,
+        "table": table_name,
+        "execute_result_tableInfo": info[0],
+        "execute_result_columns": columns,
+        "execute_result_indexes": indexes,
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Get table overview tool response: %s", response_text)
 
-            response_data = {
-                "executeSql": sql,
-                "success": True,
-                "execute_result_tableInfo": results[0],
-            }
-            response_text = json.dumps(
-                response_data, indent=2, ensure_ascii=False, default=str
-            )
-            logger.info(f"Get table info tool response: {response_text}")
+    return [TextContent(type="text", text=response_text)]
 
-            return [TextContent(type="text", text=response_text)]
 
-        elif name == "list_databases":
-            sql = "SHOW DATABASES"
-            results = db.execute_query(sql)
+async def _tool_validate_query(arguments: dict) -> list[TextContent]:
+    """Validate a query, using EXPLAIN for SELECT statements."""
+    sql = arguments.get("sql")
+    if not sql:
+        raise ValueError("SQL query is required")
 
-            databases = [row["Database"] for row in results]
+    # Use EXPLAIN to validate the query
+    try:
+        if _sql_kind(sql) == "SELECT":
+            explain_sql = f"EXPLAIN {sql}"
+            results = await db.execute_query(explain_sql)
 
             response_data = {
                 "executeSql": sql,
                 "success": True,
-                "databaseCount": len(databases),
-                "execute_result_databases": databases,
+                "valid": True,
+                "message": "Query is valid",
+                "execute_result_explainPlan": results,
             }
-            response_text = json.dumps(response_data, indent=2)
-            logger.info(f"List databases tool response: {response_text}")
+            response_text = _jdump(response_data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Validate query tool response (SELECT): %s", response_text)
 
             return [TextContent(type="text", text=response_text)]
-
-        elif name == "show_create_table":
-            table_name = arguments.get("table_name")
-            if not table_name:
-                raise ValueError("table_name is required")
-
-            # Support database.table format
-            if "." in table_name:
-                parts = table_name.split(".", 1)
-                sql = f"SHOW CREATE TABLE `{parts[0]}`.`{parts[1]}`"
-            else:
-                sql = f"SHOW CREATE TABLE `{table_name}`"
-
-            results = db.execute_query(sql)
-
-            if results:
-                create_statement = results[0].get("Create Table", "")
-                response_data = {
-                    "executeSql": sql,
-                    "success": True,
-                    "table": table_name,
-                    "execute_result_createStatement": create_statement,
-                }
-                response_text = json.dumps(response_data, indent=2)
-                logger.info(f"Show create table tool response: {response_text}")
-
-                return [TextContent(type="text", text=response_text)]
-            else:
-                raise ValueError(f"Table '{table_name}' not found")
-
-        elif name == "get_table_indexes":
-            table_name = arguments.get("table_name")
-            if not table_name:
-                raise ValueError("table_name is required")
-
-            # Support database.table format
-            if "." in table_name:
-                parts = table_name.split(".", 1)
-                sql = f"SHOW INDEX FROM `{parts[0]}`.`{parts[1]}`"
-            else:
-                sql = f"SHOW INDEX FROM `{table_name}`"
-
-            results = db.execute_query(sql)
-
+        else:
             response_data = {
                 "executeSql": sql,
                 "success": True,
-                "table": table_name,
-                "execute_result_indexes": results,
+                "valid": True,
+                "execute_result_message": "Query syntax appears valid (non-SELECT queries cannot be fully validated without execution)",
             }
-            response_text = json.dumps(response_data, indent=2, ensure_ascii=False)
-            logger.info(f"Get table indexes tool response: {response_text}")
+            response_text = _jdump(response_data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Validate query tool response (non-SELECT): %s",
+                    response_text,
+                )
 
             return [TextContent(type="text", text=response_text)]
+    except aiomysql.Error as e:
+        response_data = {
+            "executeSql": sql,
+            "success": False,
+            "valid": False,
+            "execute_result_error": str(e),
+        }
+        response_text = _jdump(response_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Validate query tool response (error): %s", response_text)
 
-        elif name == "validate_query":
-            sql = arguments.get("sql")
-            if not sql:
-                raise ValueError("SQL query is required")
+        return [TextContent(type="text", text=response_text)]
 
-            # Use EXPLAIN to validate the query
-            try:
-                if sql.strip().upper().startswith("SELECT"):
-                    explain_sql = f"EXPLAIN {sql}"
-                    results = db.execute_query(explain_sql)
-
-                    response_data = {
-                        "executeSql": sql,
-                        "success": True,
-                        "valid": True,
-                        "message": "Query is valid",
-                        "execute_result_explainPlan": results,
-                    }
-                    response_text = json.dumps(
-                        response_data, indent=2, ensure_ascii=False
-                    )
-                    logger.info(
-                        f"Validate query tool response (SELECT): {response_text}"
-                    )
-
-                    return [TextContent(type="text", text=response_text)]
-                else:
-                    response_data = {
-                        "executeSql": sql,
-                        "success": True,
-                        "valid": True,
-                        "execute_result_message": "Query syntax appears valid (non-SELECT queries cannot be fully validated without execution)",
-                    }
-                    response_text = json.dumps(response_data, indent=2)
-                    logger.info(
-                        f"Validate query tool response (non-SELECT): {response_text}"
-                    )
-
-                    return [TextContent(type="text", text=response_text)]
-            except pymysql.Error as e:
-                response_data = {
-                    "executeSql": sql,
-                    "success": False,
-                    "valid": False,
-                    "execute_result_error": str(e),
-                }
-                response_text = json.dumps(response_data, indent=2)
-                logger.info(f"Validate query tool response (error): {response_text}")
 
-                return [TextContent(type="text", text=response_text)]
+async def _tool_execute_procedure(arguments: dict) -> list[TextContent]:
+    """Create, call and optionally drop a stored procedure."""
+    procedure_sql = arguments.get("procedure_sql")
+    call_params = arguments.get("call_params", [])
+    cleanup = arguments.get("cleanup", True)
 
-        elif name == "execute_procedure":
-            procedure_sql = arguments.get("procedure_sql")
-            call_params = arguments.get("call_params", [])
-            cleanup = arguments.get("cleanup", True)
+    if not procedure_sql:
+        raise ValueError("procedure_sql is required")
 
-            if not procedure_sql:
-                raise ValueError("procedure_sql is required")
+    # Ensure it's a CREATE PROCEDURE statement
+    if not _CREATE_PROC_PREFIX.match(procedure_sql):
+        raise ValueError(
+            "Only CREATE PROCEDURE statements are allowed for 'execute_procedure' tool"
+        )
 
-            # Ensure it's a CREATE PROCEDURE statement
-            sql_upper = procedure_sql.strip().upper()
-            if not sql_upper.startswith("CREATE"):
-                raise ValueError(
-                    "Only CREATE PROCEDURE statements are allowed for 'execute_procedure' tool"
-                )
+    try:
+        result = await db.execute_procedure(procedure_sql, call_params, cleanup)
+    finally:
+        # Procedures may run DDL, so cached schema reads can be stale
+        _META_CACHE.clear()
+
+    response_data = {
+        "executeSql": procedure_sql,
+        "procedureName": result["procedure_name"],
+        "success": True,
+        "affectedRows": result["affected_rows"],
+        "resultSetCount": result["result_count"],
+        "execute_result_data": result["result_sets"],
+        "cleaned": cleanup,
+    }
+
+    # Add a human-readable message
+    if result["result_count"] > 0:
+        total_rows = sum(len(rs) for rs in result["result_sets"])
+        response_data["message"] = (
+            f"Procedure '{result['procedure_name']}' executed successfully. Returned {result['result_count']} result set(s) with {total_rows} total row(s)."
+        )
+    else:
+        response_data["message"] = (
+            f"Procedure '{result['procedure_name']}' executed successfully. Affected {result['affected_rows']} row(s)."
+        )
+
+    if cleanup:
+        response_data["message"] += " Procedure has been cleaned up."
+
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Execute procedure tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+async def _tool_invalidate_schema_cache(arguments: dict) -> list[TextContent]:
+    """Clear the schema metadata cache."""
+    cleared = len(_META_CACHE)
+    _META_CACHE.clear()
+
+    response_data = {
+        "success": True,
+        "clearedEntries": cleared,
+        "message": f"Cleared {cleared} cached schema result(s)",
+    }
+    response_text = _jdump(response_data)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Invalidate schema cache tool response: %s", response_text)
+
+    return [TextContent(type="text", text=response_text)]
+
+
+# Tool name -> handler; call_tool looks handlers up here instead of
+# walking an if/elif chain
+_DISPATCH: dict[str, Callable[[dict], Awaitable[list[TextContent]]]] = {
+    "query": _tool_query,
+    "batch_query": _tool_batch_query,
+    "execute": _tool_execute,
+    "list_tables": _tool_list_tables,
+    "describe_table": _tool_describe_table,
+    "get_table_info": _tool_get_table_info,
+    "list_databases": _tool_list_databases,
+    "show_create_table": _tool_show_create_table,
+    "get_table_indexes": _tool_get_table_indexes,
+    "get_table_overview": _tool_get_table_overview,
+    "validate_query": _tool_validate_query,
+    "execute_procedure": _tool_execute_procedure,
+    "invalidate_schema_cache": _tool_invalidate_schema_cache,
+}
+
+# Statements of the tools that run fixed SQL, echoed back on errors
+_FIXED_SQL = {
+    "list_tables": _LIST_TABLES_SQL,
+    "get_table_info": _TABLE_INFO_SQL,
+    "list_databases": _LIST_DATABASES_SQL,
+}
+
+# Per-table statement templates of the single-table tools, for the same purpose
+_TABLE_SQL = {
+    "describe_table": _DESCRIBE_SQL,
+    "show_create_table": _SHOW_CREATE_TABLE_SQL,
+    "get_table_indexes": _SHOW_INDEX_SQL,
+}
 
-            result = db.execute_procedure(procedure_sql, call_params, cleanup)
 
-            response_data = {
-                "executeSql": procedure_sql,
-                "procedureName": result["procedure_name"],
-                "success": True,
-                "affectedRows": result["affected_rows"],
-                "resultSetCount": result["result_count"],
-                "execute_result_data": result["result_sets"],
-                "cleaned": cleanup,
-            }
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MySQL tools."""
+    return _TOOLS
 
-            # Add a human-readable message
-            if result["result_count"] > 0:
-                total_rows = sum(len(rs) for rs in result["result_sets"])
-                response_data["message"] = (
-                    f"Procedure '{result['procedure_name']}' executed successfully. Returned {result['result_count']} result set(s) with {total_rows} total row(s)."
-                )
-            else:
-                response_data["message"] = (
-                    f"Procedure '{result['procedure_name']}' executed successfully. Affected {result['affected_rows']} row(s)."
-                )
 
-            if cleanup:
-                response_data["message"] += " Procedure has been cleaned up."
+@app.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Handle tool execution requests."""
+    # Extract SQL for error reporting
+    sql = arguments.get("sql", "")
+    table_name = arguments.get("table_name", "")
 
-            response_text = json.dumps(
-                response_data, indent=2, ensure_ascii=False, default=str
-            )
-            logger.info(f"Execute procedure tool response: {response_text}")
+    try:
+        # Reject oversized payloads before any string processing or logging
+        _check_payload_size(arguments)
 
-            return [TextContent(type="text", text=response_text)]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool called: %s with arguments: %s", name, arguments)
 
-        else:
+        handler = _DISPATCH.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
 
     except Exception as e:
         logger.error(f"Tool execution error: {e}")
@@ -688,60 +1202,52 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         # Build error response with executeSql if available
         response_data = {"success": False, "error": str(e)}
 
-        # Add executeSql field for tools that use SQL
-        if sql:
+        # Add executeSql field for tools that use SQL (oversized or
+        # non-string SQL is not echoed back)
+        if isinstance(sql, str) and sql and len(sql) <= _MAX_SQL_LENGTH:
             response_data["executeSql"] = sql
-        elif table_name:
-            # For table operations, construct the SQL that would have been executed
-            if name == "describe_table":
-                if "." in table_name:
-                    parts = table_name.split(".", 1)
-                    response_data["executeSql"] = f"DESCRIBE `{parts[0]}`.`{parts[1]}`"
-                else:
-                    response_data["executeSql"] = f"DESCRIBE `{table_name}`"
-            elif name == "show_create_table":
-                if "." in table_name:
-                    parts = table_name.split(".", 1)
-                    response_data["executeSql"] = (
-                        f"SHOW CREATE TABLE `{parts[0]}`.`{parts[1]}`"
-                    )
-                else:
-                    response_data["executeSql"] = f"SHOW CREATE TABLE `{table_name}`"
-            elif name == "get_table_indexes":
-                if "." in table_name:
-                    parts = table_name.split(".", 1)
-                    response_data["executeSql"] = (
-                        f"SHOW INDEX FROM `{parts[0]}`.`{parts[1]}`"
-                    )
-                else:
-                    response_data["executeSql"] = f"SHOW INDEX FROM `{table_name}`"
-
-        response_text = json.dumps(response_data, indent=2)
-        logger.info(f"Tool error response: {response_text}")
+        elif name in _FIXED_SQL:
+            response_data["executeSql"] = _FIXED_SQL[name]
+        elif name in _TABLE_SQL and table_name:
+            # Rebuild the statement through the same cached builder as the
+            # handler; names that failed validation never ran, so they are
+            # not echoed back
+            with contextlib.suppress(TypeError, ValueError):
+                response_data["executeSql"] = _table_sql(_TABLE_SQL[name], table_name)
+
+        response_text = _jdump(response_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool error response: %s", response_text)
 
         return [TextContent(type="text", text=response_text)]
 
 
+# SSE transport with the message endpoint (must have trailing slash); shared
+# by every app built by create_app() so sessions live in one place
+sse = SseServerTransport("/messages/")
+
+
 def create_app() -> Starlette:
     """Create and configure the Starlette application."""
 
-    # Create SSE transport with the message endpoint (must have trailing slash)
-    sse = SseServerTransport("/messages/")
+    # Initialization options are static; build them once, not per connection
+    init_opts = app.create_initialization_options()
 
     async def handle_sse(request):
         """
         Handle SSE connection endpoint.
         This establishes the SSE stream for server-to-client communication.
         """
-        logger.info(f"New SSE connection from {request.client.host}")
+        logger.debug("New SSE connection from %s", request.client.host)
 
+        # Starlette has no public accessor for the raw ASGI send callable;
+        # request._send is the attribute the MCP SSE examples rely on and
+        # has been stable across the starlette>=0.27 range we support
         async with sse.connect_sse(
             request.scope, request.receive, request._send
         ) as streams:
             try:
-                await app.run(
-                    streams[0], streams[1], app.create_initialization_options()
-                )
+                await app.run(streams[0], streams[1], init_opts)
             except Exception as e:
                 logger.error(f"Error in SSE connection: {e}")
                 raise
@@ -749,10 +1255,20 @@ def create_app() -> Starlette:
         # Must return Response to avoid NoneType error
         return Response()
 
+    @contextlib.asynccontextmanager
+    async def lifespan(starlette_app: Starlette):
+        """Open the MySQL pool on startup and drain it on shutdown."""
+        await db.connect()
+        starlette_app.state.pool = db.pool
+        try:
+            yield
+        finally:
+            await db.close()
+
     # Create Starlette app with routes
     # Note: Mount path must match the endpoint in SseServerTransport
     starlette_app = Starlette(
-        debug=True,
+        lifespan=lifespan,
         routes=[
             Route("/sse", endpoint=handle_sse, methods=["GET"]),
             Mount("/messages/", app=sse.handle_post_message),
@@ -772,9 +1288,11 @@ async def main():
     config = DatabaseConfig.display_config()
     logger.info(f"Database: {config}")
 
-    # Get configuration
+    # Get configuration. SSE sessions live in process memory, so this runs
+    # as a single process (no uvicorn workers); scale out with instances on
+    # separate MCP_PORTs behind a proxy that keeps each client on one instance
     host = "0.0.0.0"
-    port = 17110
+    port = int(os.getenv("MCP_PORT", "17110"))
 
     logger.info(f"Server URL: http://{host}:{port}")
     logger.info(f"SSE Endpoint: http://{host}:{port}/sse")
@@ -785,7 +1303,17 @@ async def main():
     starlette_app = create_app()
 
     config_uvicorn = uvicorn.Config(
-        starlette_app, host=host, port=port, log_level="info"
+        starlette_app,
+        host=host,
+        port=port,
+        # Same level as the rest of the server, so per-request access
+        # logs only appear at LOG_LEVEL=INFO or lower
+        log_level=logging.getLogger().level,
+        # Leave uvicorn's loggers unconfigured so their records propagate to
+        # the root QueueHandler instead of uvicorn's own stream handlers
+        log_config=None,
+        http="httptools",
+        lifespan="on",
     )
 
     server = uvicorn.Server(config_uvicorn)
@@ -793,9 +1321,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    # main() owns the event loop (uvicorn's loop= setting does not apply to
+    # server.serve()), so run it directly on a uvloop event loop
     try:
-        asyncio.run(main())
+        uvloop.run(main())
     except KeyboardInterrupt:
         logger.info("\nServer stopped by user")
-    finally:
-        db.close()
@@ -49,7 +49,7 @@ fi
 
 # 检查依赖
 echo "🔍 检查依赖..."
-python3 -c "import mcp; import starlette; import uvicorn" 2>/dev/null
+python3 -c "import mcp; import starlette; import uvicorn; import uvloop; import httptools; import aiomysql; import cachetools; import orjson; import dotenv" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "📥 安装依赖..."
     pip install -r requirements.txt